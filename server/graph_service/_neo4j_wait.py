@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import socket
+import ssl
+import struct
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+BOLT_MAGIC = b'\x60\x60\xb0\x17'
+# Proposed protocol versions, as (range << 16) | (minor << 8) | major:
+# 5.4-5.0, 4.4-4.2, 4.0, 3.0
+BOLT_VERSIONS = struct.pack('>IIII', 0x00040405, 0x00020404, 0x00000004, 0x00000003)
+
+
+def configure_socket(sock: socket.socket) -> None:
+    """Disable Nagle and enable keepalive so dead peers are detected promptly"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Keepalive tuning options are platform specific (Linux)
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4)
+
+
+def ssl_context_for(scheme: str) -> ssl.SSLContext | None:
+    """Return the TLS context a Neo4j URI scheme calls for, or None for plaintext"""
+    if scheme.endswith('+ssc'):
+        # Self-signed certificates: encrypt but skip verification
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+    if scheme.endswith('+s'):
+        return ssl.create_default_context()
+    return None
+
+
+async def bolt_handshake(host: str, port: int, ssl_context: ssl.SSLContext | None = None) -> bool:
+    """Perform a Bolt handshake and return whether the server agreed on a version"""
+    reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+    try:
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            configure_socket(sock)
+        writer.write(BOLT_MAGIC + BOLT_VERSIONS)
+        await writer.drain()
+        version = await reader.readexactly(4)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    return version != b'\x00\x00\x00\x00'
+
+
+@lru_cache(maxsize=8)
+def parse_bolt_uri(uri: str) -> tuple[str, str, int]:
+    """Extract (scheme, host, port) from a Neo4j URI such as bolt://[::1]:7687 or neo4j+s://host"""
+    parsed = urlsplit(uri if '://' in uri else f'bolt://{uri}')
+    return parsed.scheme, parsed.hostname or 'localhost', parsed.port or 7687
+
+
+async def wait_for_neo4j(uri: str, max_retries: int = 30, retry_delay: float = 2.0) -> bool:
+    """Wait for Neo4j to be ready"""
+    scheme, host, port = parse_bolt_uri(uri)
+    ssl_context = ssl_context_for(scheme)
+
+    logger.info(f'Waiting for Neo4j at {host}:{port}')
+
+    for attempt in range(max_retries):
+        try:
+            # A listening port is not enough: Neo4j must also answer the Bolt handshake
+            if await asyncio.wait_for(bolt_handshake(host, port, ssl_context), timeout=5):
+                logger.info(f'Neo4j is ready at {host}:{port}')
+                return True
+
+            logger.warning(f'Neo4j rejected Bolt handshake (attempt {attempt + 1}/{max_retries})')
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            logger.warning(f'Neo4j not ready (attempt {attempt + 1}/{max_retries})')
+        except Exception as e:
+            logger.warning(f'Connection attempt failed (attempt {attempt + 1}/{max_retries}): {e}')
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 1.2, 10)  # Gradual backoff
+
+    logger.error('Neo4j failed to become ready after all retries')
+    return False
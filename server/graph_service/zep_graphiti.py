@@ -91,15 +91,21 @@ async def get_graphiti(settings: ZepEnvDep):
         await client.close()
 
 
-async def initialize_graphiti(settings: ZepEnvDep):
+def create_graphiti(settings: ZepEnvDep) -> ZepGraphiti:
+    """Construct a Graphiti client without touching the database"""
+    return ZepGraphiti(
+        uri=settings.neo4j_uri,
+        user=settings.neo4j_user,
+        password=settings.neo4j_password,
+    )
+
+
+async def initialize_graphiti(settings: ZepEnvDep, client: ZepGraphiti | None = None):
     """Initialize Graphiti with graceful error handling"""
     try:
         logger.info("Initializing Graphiti...")
-        client = ZepGraphiti(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password,
-        )
+        if client is None:
+            client = create_graphiti(settings)
         await client.build_indices_and_constraints()
         logger.info("Graphiti initialized successfully")
     except Exception as e:
@@ -3,25 +3,23 @@
 Simple test script to verify Graphiti deployment
 """
 
-import requests
+import asyncio
+import httpx
+import os
 import sys
-import time
 
-def test_endpoint(url, description):
-    """Test an endpoint and return success status"""
+async def test_endpoint(client, url, description):
+    """Test an endpoint and return success status with a report line"""
     try:
-        response = requests.get(url, timeout=10)
+        response = await client.get(url)
         if response.status_code == 200:
-            print(f"✓ {description}: {url}")
-            return True
+            return True, f"✓ {description}: {url}"
         else:
-            print(f"✗ {description}: {url} (status: {response.status_code})")
-            return False
+            return False, f"✗ {description}: {url} (status: {response.status_code})"
     except Exception as e:
-        print(f"✗ {description}: {url} (error: {e})")
-        return False
+        return False, f"✗ {description}: {url} (error: {e})"
 
-def main():
+async def main():
     """Test the deployment"""
     print("Testing Graphiti deployment...")
     
@@ -31,22 +29,34 @@ def main():
         ("http://localhost:8000/healthcheck", "Health check"),
     ]
     
-    success_count = 0
     total_count = len(endpoints)
     
-    for url, description in endpoints:
-        if test_endpoint(url, description):
-            success_count += 1
-        time.sleep(1)  # Small delay between requests
+    # Optional one-off wait for a server that is still starting up
+    startup_grace = float(os.getenv("STARTUP_GRACE", "0"))
+    if startup_grace > 0:
+        await asyncio.sleep(startup_grace)
     
-    print(f"\nResults: {success_count}/{total_count} endpoints working")
+    # Share one keep-alive client and probe all endpoints concurrently
+    async with httpx.AsyncClient(timeout=10) as client:
+        results = await asyncio.gather(
+            *(test_endpoint(client, url, description) for url, description in endpoints)
+        )
+    
+    # Buffer the report and write it out in one go
+    out = [line for _, line in results]
+    success_count = sum(ok for ok, _ in results)
+    
+    out.append(f"\nResults: {success_count}/{total_count} endpoints working")
     
     if success_count == total_count:
-        print("✓ Deployment is working correctly!")
-        return 0
+        out.append("✓ Deployment is working correctly!")
+        exit_code = 0
     else:
-        print("✗ Some endpoints are not working")
-        return 1
+        out.append("✗ Some endpoints are not working")
+        exit_code = 1
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    return exit_code
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
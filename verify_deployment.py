@@ -6,14 +6,63 @@ Deployment verification script for Graphiti on Dokploy
 import os
 import sys
 import asyncio
-import aiohttp
+import httpx
 import logging
 from typing import Dict, List, Optional
+from urllib.parse import urlsplit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+REQUIRED_VARS = (
+    'OPENAI_API_KEY',
+    'NEO4J_USER',
+    'NEO4J_PASSWORD',
+)
+
+OPTIONAL_VARS = (
+    'MODEL_NAME',
+    'EMBEDDING_MODEL_NAME',
+    'SEMAPHORE_LIMIT',
+)
+
+# Read the environment once; every check below works from this snapshot
+ENV = {var: os.getenv(var, '') for var in REQUIRED_VARS + OPTIONAL_VARS + ('NEO4J_URI',)}
+
+NEO4J_SCHEMES = frozenset(
+    scheme + suffix for scheme in ('bolt', 'neo4j') for suffix in ('', '+s', '+ssc')
+)
+
+# Assuming localhost for this script
+SERVER_URL = "http://localhost:8000"
+# Upper bound on the wall time of all connectivity checks combined
+VERIFY_TIMEOUT = 30
+
+API_ENDPOINTS = {
+    'root': '/',
+    'healthcheck': '/healthcheck',
+}
+
+_client: httpx.AsyncClient | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use"""
+    global _client
+    if _client is None:
+        limits = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+        _client = httpx.AsyncClient(base_url=SERVER_URL, timeout=10, limits=limits)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client; the next get_client() call rebuilds it"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
 
 async def check_neo4j_connection(uri: str, user: str, password: str) -> bool:
     """Check if Neo4j is accessible"""
@@ -22,7 +71,8 @@ async def check_neo4j_connection(uri: str, user: str, password: str) -> bool:
         logger.info(f"Checking Neo4j connection to {uri}")
         
         # For now, just check if the URI format is correct
-        if not uri.startswith('bolt://'):
+        parsed = urlsplit(uri)
+        if parsed.scheme not in NEO4J_SCHEMES or not parsed.hostname:
             logger.error(f"Invalid Neo4j URI format: {uri}")
             return False
             
@@ -33,80 +83,67 @@ async def check_neo4j_connection(uri: str, user: str, password: str) -> bool:
         return False
 
 
-async def check_server_health(url: str) -> bool:
+async def check_server_health(client: httpx.AsyncClient, url: str) -> bool:
     """Check if a server is healthy"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{url}/healthcheck", timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Server health check passed: {url}")
-                    return True
-                else:
-                    logger.error(f"Server health check failed with status {response.status}: {url}")
-                    return False
+        response = await client.get(f"{url}/healthcheck")
+        if response.status_code == 200:
+            logger.info(f"Server health check passed: {url}")
+            return True
+        else:
+            logger.error(f"Server health check failed with status {response.status_code}: {url}")
+            return False
     except Exception as e:
         logger.error(f"Server health check failed: {url} - {e}")
         return False
 
 
-async def check_api_endpoints(base_url: str) -> Dict[str, bool]:
+async def check_endpoint(client: httpx.AsyncClient, name: str, url: str) -> bool:
+    """Check a single API endpoint"""
+    try:
+        response = await client.get(url)
+        if response.status_code == 200:
+            logger.info(f"Endpoint {name} is accessible")
+            return True
+        else:
+            logger.warning(f"Endpoint {name} returned status {response.status_code}")
+            return False
+    except Exception as e:
+        logger.error(f"Endpoint {name} check failed: {e}")
+        return False
+
+
+async def check_api_endpoints(client: httpx.AsyncClient, base_url: str) -> Dict[str, bool]:
     """Check various API endpoints"""
-    endpoints = {
-        'root': '/',
-        'healthcheck': '/healthcheck',
-    }
-    
-    results = {}
-    
-    for name, endpoint in endpoints.items():
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{base_url}{endpoint}", timeout=10) as response:
-                    results[name] = response.status == 200
-                    if response.status == 200:
-                        logger.info(f"Endpoint {name} is accessible")
-                    else:
-                        logger.warning(f"Endpoint {name} returned status {response.status}")
-        except Exception as e:
-            logger.error(f"Endpoint {name} check failed: {e}")
-            results[name] = False
+    # Endpoint checks are independent, so run them concurrently
+    tasks = [
+        check_endpoint(client, name, f"{base_url}{endpoint}")
+        for name, endpoint in API_ENDPOINTS.items()
+    ]
+    statuses = await asyncio.gather(*tasks)
     
-    return results
+    return dict(zip(API_ENDPOINTS, statuses, strict=True))
 
 
-def check_environment_variables() -> Dict[str, bool]:
+def check_environment_variables(env: Dict[str, str] = ENV) -> Dict[str, bool]:
     """Check if required environment variables are set"""
-    required_vars = [
-        'OPENAI_API_KEY',
-        'NEO4J_USER',
-        'NEO4J_PASSWORD',
-    ]
-    
-    optional_vars = [
-        'MODEL_NAME',
-        'EMBEDDING_MODEL_NAME',
-        'SEMAPHORE_LIMIT',
-    ]
-    
-    results = {}
+    results = {var: bool(env[var].strip()) for var in REQUIRED_VARS + OPTIONAL_VARS}
     
     # Check required variables
-    for var in required_vars:
-        value = os.getenv(var)
-        results[var] = value is not None and value.strip() != ''
-        if results[var]:
-            logger.info(f"Required environment variable {var} is set")
-        else:
-            logger.error(f"Required environment variable {var} is missing or empty")
-    
-    # Check optional variables
-    for var in optional_vars:
-        value = os.getenv(var)
-        results[var] = value is not None and value.strip() != ''
-        if results[var]:
-            logger.info(f"Optional environment variable {var} is set: {value}")
-        else:
-            logger.warning(f"Optional environment variable {var} is not set (using default)")
+    missing_required = [var for var in REQUIRED_VARS if not results[var]]
+    if missing_required:
+        logger.error("Required environment variables missing or empty: %s", ', '.join(missing_required))
+    else:
+        logger.info("All required environment variables are set")
+    
+    # Check optional variables; joining the listings is skipped when INFO is filtered
+    if logger.isEnabledFor(logging.INFO):
+        set_optional = [f"{var}={env[var]}" for var in OPTIONAL_VARS if results[var]]
+        if set_optional:
+            logger.info("Optional environment variables set: %s", ', '.join(set_optional))
+    unset_optional = [var for var in OPTIONAL_VARS if not results[var]]
+    if unset_optional:
+        logger.warning("Optional environment variables not set (using defaults): %s", ', '.join(unset_optional))
     
     return results
 
@@ -119,19 +156,40 @@ async def main():
     env_check = check_environment_variables()
     
     # Get configuration from environment
-    neo4j_uri = os.getenv('NEO4J_URI', 'bolt://neo4j:7687')
-    neo4j_user = os.getenv('NEO4J_USER', 'neo4j')
-    neo4j_password = os.getenv('NEO4J_PASSWORD', '')
-    
-    # Check Neo4j connection
-    neo4j_ok = await check_neo4j_connection(neo4j_uri, neo4j_user, neo4j_password)
+    neo4j_uri = ENV['NEO4J_URI'] or 'bolt://neo4j:7687'
+    neo4j_user = ENV['NEO4J_USER'] or 'neo4j'
+    neo4j_password = ENV['NEO4J_PASSWORD']
     
-    # Check server health (assuming localhost for this script)
-    server_url = "http://localhost:8000"
-    server_health = await check_server_health(server_url)
-    
-    # Check API endpoints
-    api_endpoints = await check_api_endpoints(server_url)
+    # Share one pooled client across all HTTP checks
+    try:
+        client = await get_client()
+        
+        # Neo4j, server health and API endpoint checks are independent,
+        # so run them concurrently under a single overall deadline
+        neo4j_task = asyncio.create_task(
+            check_neo4j_connection(neo4j_uri, neo4j_user, neo4j_password)
+        )
+        health_task = asyncio.create_task(check_server_health(client, SERVER_URL))
+        api_task = asyncio.create_task(check_api_endpoints(client, SERVER_URL))
+        
+        _, pending = await asyncio.wait(
+            (neo4j_task, health_task, api_task), timeout=VERIFY_TIMEOUT
+        )
+        
+        # Cancel only the stragglers; checks that finished keep their results
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            logger.error("%d verification check(s) timed out after %ss", len(pending), VERIFY_TIMEOUT)
+        
+        neo4j_ok = neo4j_task not in pending and neo4j_task.result()
+        server_health = health_task not in pending and health_task.result()
+        api_endpoints = (
+            {name: False for name in API_ENDPOINTS} if api_task in pending else api_task.result()
+        )
+    finally:
+        await close_client()
     
     # Summary
     logger.info("\n" + "="*50)
@@ -139,7 +197,7 @@ async def main():
     logger.info("="*50)
     
     # Environment variables
-    required_env_ok = all(env_check.get(var, False) for var in ['OPENAI_API_KEY', 'NEO4J_USER', 'NEO4J_PASSWORD'])
+    required_env_ok = all(env_check.get(var, False) for var in REQUIRED_VARS)
     logger.info(f"Environment Variables: {'✓' if required_env_ok else '✗'}")
     
     # Neo4j